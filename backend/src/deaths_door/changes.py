@@ -1,9 +1,12 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Changes(BaseModel):
     """Represents the changes to the number of roles in the Script."""
 
+    # Built once per character class and shared, so it must not be mutated
+    model_config = ConfigDict(frozen=True)
+
     townsfolk: None | int = None
     outsider: None | int = None
     minion: None | int = None
@@ -1,4 +1,9 @@
-from pydantic import BaseModel
+from __future__ import annotations
+
+import sys
+from typing import Any, Iterable, Self
+
+from pydantic import BaseModel, ConfigDict
 
 from .alignment import Alignment
 from .changes import Changes
@@ -9,6 +14,9 @@ from .status_effects import StatusEffect, StatusEffectOut
 class CharacterOut(BaseModel):
     """A character with only fields meant to be sent to the client."""
 
+    # Instances are cached and shared per character class, see Character.to_out
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     icon_path: str
@@ -17,59 +25,74 @@ class CharacterOut(BaseModel):
 
 
 class Character:
-    """A character in the script."""
+    """
+    A character in the script.
+
+    Subclasses declare their name, description, category, alignment, status effects
+    and changes as class attributes, so instances carry no state of their own.
+    """
+
+    # Characters have no instance state, so don't give them a __dict__
+    __slots__ = ()
 
     name: str
     description: str
     category: CharacterType
     alignment: Alignment
-    status_effects: list[StatusEffect]
-    changes: None | Changes
-
-    def get_name(self) -> str:
-        """Return the character's name."""
-        return self.name
-
-    def get_description(self) -> str:
-        """Return the character's description."""
-        return self.description
-
-    def get_alignment(self) -> Alignment:
-        """Return the character's alignment."""
-        return self.alignment
-
-    def get_category(self) -> CharacterType:
-        """Return the character's category."""
-        return self.category
+    status_effects: tuple[StatusEffect, ...] = ()
+    changes: None | Changes = None
+    icon_path: str
+    normalized_name: str
+    _out: CharacterOut
+    _status_effects_out: tuple[StatusEffectOut, ...]
+    _repr: str
+    _instance: None | Character
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Derive per-class values from the subclass's constants once."""
+        super().__init_subclass__(**kwargs)
+        cls.icon_path = cls.name.lower().replace(" ", "") + ".png"
+        # Interned so the script and game indexes share one key per character
+        cls.normalized_name = sys.intern(cls.name.lower().strip())
+        # Every field comes from class constants of the right type, so skip validation
+        cls._out = CharacterOut.model_construct(
+            name=cls.name,
+            description=cls.description,
+            icon_path=cls.icon_path,
+            alignment=cls.alignment,
+            category=cls.category,
+        )
+        cls._status_effects_out = tuple(
+            status_effect.to_out(cls.name) for status_effect in cls.status_effects
+        )
+        cls._repr = f"Character({cls.name})"
+        cls._instance = None
 
-    def normalize(self, s: str) -> str:
-        """Normalize a character name for comparisons."""
-        return s.lower().strip()
+    def __new__(cls) -> Self:
+        """Return the existing instance of the character, if present."""
+        instance = cls._instance
+        if not isinstance(instance, cls):
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
 
     def is_named(self, name: str) -> bool:
         """Check if the character matches the given name."""
-        return self.normalize(self.name) == self.normalize(name)
+        return self.normalized_name == name.lower().strip()
 
-    def get_icon_path(self) -> str:
-        """Return the character's icon."""
-        return self.name.lower().replace(" ", "") + ".png"
-
-    def get_status_effects_out(self) -> list[StatusEffectOut]:
+    def get_status_effects_out(self) -> tuple[StatusEffectOut, ...]:
         """Return the character's status effects."""
-        return [
-            status_effect.to_out(self.name) for status_effect in self.status_effects
-        ]
+        return self._status_effects_out
 
     def to_out(self) -> CharacterOut:
         """Convert the character to a character out."""
-        return CharacterOut(
-            name=self.name,
-            description=self.description,
-            icon_path=self.get_icon_path(),
-            alignment=self.alignment,
-            category=self.category,
-        )
+        return self._out
 
     def __repr__(self) -> str:
         """Return a string representation of the character."""
-        return f"Character({self.name})"
+        return self._repr
+
+
+def characters_to_out(characters: Iterable[Character]) -> list[CharacterOut]:
+    """Convert characters to the payloads sent to the client."""
+    return [character.to_out() for character in characters]
@@ -1,20 +1,19 @@
 from ...alignment import Alignment
 from ...character import Character
 from ...character_type import CharacterType
-from ...status_effects import ButlersMaster
+from ...status_effects import BUTLERS_MASTER
 
 
 class Butler(Character):
     """Butler character."""
 
-    def __init__(self):
-        """Initialize the Butler character."""
-        self.name = "Butler"
-        self.description = (
-            "Each night, choose a player (not yourself): tomorrow,"
-            + " you may only vote if they are."
-            + " You cannot be drunk or poisoned."
-        )
-        self.category = CharacterType.OUTSIDER
-        self.alignment = Alignment.GOOD
-        self.status_effects = [ButlersMaster()]
+    __slots__ = ()
+    name = "Butler"
+    description = (
+        "Each night, choose a player (not yourself): tomorrow,"
+        " you may only vote if they are."
+        " You cannot be drunk or poisoned."
+    )
+    category = CharacterType.OUTSIDER
+    alignment = Alignment.GOOD
+    status_effects = (BUTLERS_MASTER,)
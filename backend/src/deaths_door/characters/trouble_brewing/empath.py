@@ -6,12 +6,8 @@ from ...character_type import CharacterType
 class Empath(Character):
     """Empath character."""
 
-    def __init__(self):
-        """Initialize the Empath character."""
-        self.name = "Empath"
-        self.description = (
-            "Each night, you learn how many of your 2 alive neighbors are evil."
-        )
-        self.category = CharacterType.TOWNSFOLK
-        self.alignment = Alignment.GOOD
-        self.status_effects = []
+    __slots__ = ()
+    name = "Empath"
+    description = "Each night, you learn how many of your 2 alive neighbors are evil."
+    category = CharacterType.TOWNSFOLK
+    alignment = Alignment.GOOD
@@ -1,19 +1,18 @@
 from ...alignment import Alignment
 from ...character import Character
 from ...character_type import CharacterType
-from ...status_effects import RedHerring
+from ...status_effects import RED_HERRING
 
 
 class FortuneTeller(Character):
     """Fortune Teller character."""
 
-    def __init__(self):
-        """Initialize the Fortune Teller character."""
-        self.name = "Fortune Teller"
-        self.description = (
-            "Each night, choose 2 players: you learn if either is a Demon."
-            + " There is 1 good player that registers falsely to you."
-        )
-        self.category = CharacterType.TOWNSFOLK
-        self.alignment = Alignment.GOOD
-        self.status_effects = [RedHerring()]
+    __slots__ = ()
+    name = "Fortune Teller"
+    description = (
+        "Each night, choose 2 players: you learn if either is a Demon."
+        " There is 1 good player that registers falsely to you."
+    )
+    category = CharacterType.TOWNSFOLK
+    alignment = Alignment.GOOD
+    status_effects = (RED_HERRING,)
@@ -1,20 +1,19 @@
 from ...alignment import Alignment
 from ...character import Character
 from ...character_type import CharacterType
-from ...status_effects import Dead, IsTheDrunk
+from ...status_effects import DEAD, IS_THE_DRUNK
 
 
 class Imp(Character):
     """Imp character."""
 
-    def __init__(self):
-        """Initialize the Imp character."""
-        self.name = "Imp"
-        self.description = (
-            "Each night*, choose a player: they die. "
-            + "If you chose yourself, you die & a Minion becomes the Imp."
-        )
-        self.category = CharacterType.DEMON
-        self.alignment = Alignment.EVIL
-        # Imp includes Drunk because imp is always present in the game
-        self.status_effects = [IsTheDrunk(), Dead()]
+    __slots__ = ()
+    name = "Imp"
+    description = (
+        "Each night*, choose a player: they die. "
+        "If you chose yourself, you die & a Minion becomes the Imp."
+    )
+    category = CharacterType.DEMON
+    alignment = Alignment.EVIL
+    # Imp includes Drunk because imp is always present in the game
+    status_effects = (IS_THE_DRUNK, DEAD)
@@ -1,19 +1,18 @@
 from ...alignment import Alignment
 from ...character import Character
 from ...character_type import CharacterType
-from ...status_effects import Poisoned
+from ...status_effects import POISONED
 
 
 class Poisoner(Character):
     """Poisoner character."""
 
-    def __init__(self):
-        """Initialize the Poisoner character."""
-        self.name = "Poisoner"
-        self.description = (
-            "Each night, choose a player:"
-            + " their ability malfunctions tonight and tomorrow day."
-        )
-        self.category = CharacterType.MINION
-        self.alignment = Alignment.EVIL
-        self.status_effects = [Poisoned()]
+    __slots__ = ()
+    name = "Poisoner"
+    description = (
+        "Each night, choose a player:"
+        " their ability malfunctions tonight and tomorrow day."
+    )
+    category = CharacterType.MINION
+    alignment = Alignment.EVIL
+    status_effects = (POISONED,)
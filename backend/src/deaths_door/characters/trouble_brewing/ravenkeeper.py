@@ -6,13 +6,11 @@ from ...character_type import CharacterType
 class Ravenkeeper(Character):
     """Ravenkeeper character."""
 
-    def __init__(self):
-        """Initialize the Ravenkeeper character."""
-        self.name = "Ravenkeeper"
-        self.description = (
-            "If you die at night, you are woken to choose a player: "
-            + "you learn their character."
-        )
-        self.category = CharacterType.TOWNSFOLK
-        self.alignment = Alignment.GOOD
-        self.status_effects = []
+    __slots__ = ()
+    name = "Ravenkeeper"
+    description = (
+        "If you die at night, you are woken to choose a player: "
+        "you learn their character."
+    )
+    category = CharacterType.TOWNSFOLK
+    alignment = Alignment.GOOD
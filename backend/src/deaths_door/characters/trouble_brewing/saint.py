@@ -6,10 +6,8 @@ from ...character_type import CharacterType
 class Saint(Character):
     """Saint character."""
 
-    def __init__(self):
-        """Initialize the Saint character."""
-        self.name = "Saint"
-        self.description = "If you die by execution, you lose."
-        self.category = CharacterType.OUTSIDER
-        self.alignment = Alignment.GOOD
-        self.status_effects = []
+    __slots__ = ()
+    name = "Saint"
+    description = "If you die by execution, you lose."
+    category = CharacterType.OUTSIDER
+    alignment = Alignment.GOOD
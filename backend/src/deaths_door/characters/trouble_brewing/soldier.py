@@ -6,10 +6,8 @@ from ...character_type import CharacterType
 class Soldier(Character):
     """Soldier character."""
 
-    def __init__(self):
-        """Initialize the Soldier character."""
-        self.name = "Soldier"
-        self.description = "You are safe from the Demon."
-        self.category = CharacterType.TOWNSFOLK
-        self.alignment = Alignment.GOOD
-        self.status_effects = []
+    __slots__ = ()
+    name = "Soldier"
+    description = "You are safe from the Demon."
+    category = CharacterType.TOWNSFOLK
+    alignment = Alignment.GOOD
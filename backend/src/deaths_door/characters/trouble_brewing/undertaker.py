@@ -1,18 +1,15 @@
 from ...alignment import Alignment
 from ...character import Character
 from ...character_type import CharacterType
-from ...status_effects import DiedToday
+from ...status_effects import DIED_TODAY
 
 
 class Undertaker(Character):
     """Undertaker character."""
 
-    def __init__(self):
-        """Initialize the Undertaker character."""
-        self.name = "Undertaker"
-        self.description = (
-            "Each night*, you learn a character that died by execution today."
-        )
-        self.category = CharacterType.TOWNSFOLK
-        self.alignment = Alignment.GOOD
-        self.status_effects = [DiedToday()]
+    __slots__ = ()
+    name = "Undertaker"
+    description = "Each night*, you learn a character that died by execution today."
+    category = CharacterType.TOWNSFOLK
+    alignment = Alignment.GOOD
+    status_effects = (DIED_TODAY,)
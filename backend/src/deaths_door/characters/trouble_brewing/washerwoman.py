@@ -1,18 +1,15 @@
 from ...alignment import Alignment
 from ...character import Character
 from ...character_type import CharacterType
-from ...status_effects import WasherwomanTownsfolk, WasherwomanWrong
+from ...status_effects import WASHERWOMAN_TOWNSFOLK, WASHERWOMAN_WRONG
 
 
 class Washerwoman(Character):
     """Washerwoman character."""
 
-    def __init__(self):
-        """Initialize the Washerwoman character."""
-        self.name = "Washerwoman"
-        self.description = (
-            "You start knowing that 1 of 2 players is a particular Townsfolk."
-        )
-        self.category = CharacterType.TOWNSFOLK
-        self.alignment = Alignment.GOOD
-        self.status_effects = [WasherwomanTownsfolk(), WasherwomanWrong()]
+    __slots__ = ()
+    name = "Washerwoman"
+    description = "You start knowing that 1 of 2 players is a particular Townsfolk."
+    category = CharacterType.TOWNSFOLK
+    alignment = Alignment.GOOD
+    status_effects = (WASHERWOMAN_TOWNSFOLK, WASHERWOMAN_WRONG)
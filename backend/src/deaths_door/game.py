@@ -2,23 +2,88 @@ from __future__ import annotations
 
 import secrets
 from itertools import chain
-from typing import Generator
+from operator import attrgetter
+from typing import Generator, Iterable
 
 from .character import Character
+from .characters.trouble_brewing import (
+    Baron,
+    Empath,
+    Imp,
+    Investigator,
+    Librarian,
+    Mayor,
+    Monk,
+    Poisoner,
+    Recluse,
+    ScarletWoman,
+    Slayer,
+    Soldier,
+)
 from .night_step import NightStep
 from .player import Player
-from .script import Script, ScriptName
+from .script import Script
+from .script_name import ScriptName
 from .scripts.registry import get_script_by_name
 from .status_effects import StatusEffectOut
 
+# Characters are singletons, so the sample game's roles can be resolved once
+_SAMPLE_ROLES = (
+    Imp(),
+    Baron(),
+    Poisoner(),
+    Recluse(),
+    Librarian(),
+    Empath(),
+    Investigator(),
+    Mayor(),
+    Soldier(),
+    Slayer(),
+    ScarletWoman(),
+    Monk(),
+)
+_SAMPLE_PLAYER_NAMES = (
+    "Ryan",
+    "Yash",
+    "Other Ryan",
+    "Other Yash",
+    "Yet Another Ryan",
+    "Yet Another Yash",
+    "Even More Ryan",
+    "Even More Yash",
+)
+
 
 class Game:
     """Representation of the current game state."""
 
+    __slots__ = (
+        "script",
+        "included_roles",
+        "players",
+        "should_reveal_roles",
+        "_roles_by_name",
+        "_players_by_name",
+        "_role_bag",
+        "_first_night_steps",
+        "_other_night_steps",
+    )
+
     script: Script
-    included_roles: list[Character]
+    # How many copies of each role are left to assign, in the order they were added
+    included_roles: dict[Character, int]
     players: list[Player]
-    should_reveal_roles: bool = False
+    should_reveal_roles: bool
+    # Indexes over included_roles and players, keyed by normalized role name and
+    # player name, kept in sync by every method that adds or removes either
+    _roles_by_name: dict[str, Character]
+    _players_by_name: dict[str, Player]
+    # Shuffled copy of included_roles that random assignment pops from, rebuilt
+    # whenever the included roles change any other way
+    _role_bag: None | list[Character]
+    # The script never changes during a game, so its steps are snapshotted once
+    _first_night_steps: tuple[NightStep, ...]
+    _other_night_steps: tuple[NightStep, ...]
 
     def __init__(self, script_name: ScriptName) -> None:
         """Create a new game."""
@@ -27,8 +92,14 @@ class Game:
             raise ValueError(f"Invalid script: {script_name}")
 
         self.script = script
-        self.included_roles = []
+        self._first_night_steps = tuple(script.get_first_night_steps())
+        self._other_night_steps = tuple(script.get_other_night_steps())
+        self.included_roles = {}
         self.players = []
+        self.should_reveal_roles = False
+        self._roles_by_name = {}
+        self._players_by_name = {}
+        self._role_bag = None
 
     def get_should_reveal_roles(self) -> bool:
         """Get whether the roles should be revealed."""
@@ -45,25 +116,65 @@ class Game:
         if character is None:
             raise ValueError(f"Role not found: {role_name}")
 
-        self.included_roles.append(character)
+        self._add_included_role(character)
+
+    def include_roles(self, role_names: Iterable[str]) -> None:
+        """Add several roles to the game, adding none if any can't be found."""
+        characters: list[Character] = []
+        for role_name in role_names:
+            character = self.script.get_character(role_name)
+            if character is None:
+                raise ValueError(f"Role not found: {role_name}")
+            characters.append(character)
+
+        for character in characters:
+            self._add_included_role(character)
 
     def remove_role(self, role_name: str) -> None:
         """Remove a role from the game."""
-        try:
-            self.included_roles.remove(
-                next(role for role in self.included_roles if role.is_named(role_name))
-            )
-        except StopIteration as err:
-            raise ValueError(f"Role not in game: {role_name}") from err
+        character = self._roles_by_name.get(role_name.lower().strip())
+        if character is None:
+            raise ValueError(f"Role not in game: {role_name}")
+
+        self._remove_included_role(character)
+
+    def get_included_roles(self) -> list[Character]:
+        """Get the roles left to assign, repeating roles included more than once."""
+        return [
+            character
+            for character, count in self.included_roles.items()
+            for _ in range(count)
+        ]
+
+    def _add_included_role(self, character: Character) -> None:
+        """Add a character to the included roles and the index."""
+        self.included_roles[character] = self.included_roles.get(character, 0) + 1
+        self._roles_by_name[character.normalized_name] = character
+        self._role_bag = None
+
+    def _remove_included_role(self, character: Character) -> None:
+        """Remove one copy of a character from the included roles and the index."""
+        count = self.included_roles.get(character)
+        if count is None:
+            raise ValueError(f"Role not in game: {character.name}")
+
+        self._role_bag = None
+        if count > 1:
+            self.included_roles[character] = count - 1
+            return
+
+        # The last copy is gone, so the role leaves the index too
+        del self.included_roles[character]
+        del self._roles_by_name[character.normalized_name]
 
     def add_player_with_role(self, name: str, role_name: str) -> Player:
         """Add a player with a role to the game."""
         if len(self.included_roles) == 0:
             raise ValueError("No roles to assign")
 
-        character = next(
-            char for char in self.included_roles if char.is_named(role_name)
-        )
+        character = self._roles_by_name.get(role_name.lower().strip())
+        if character is None:
+            raise ValueError(f"Role not in game: {role_name}")
 
         return self.add_player_with_character(name, character)
 
@@ -72,16 +183,41 @@ class Game:
         if len(self.included_roles) == 0:
             raise ValueError("No roles to assign")
 
-        return self.add_player_with_character(name, secrets.choice(self.included_roles))
+        bag = self._role_bag
+        if bag is None:
+            bag = self.get_included_roles()
+            secrets.SystemRandom().shuffle(bag)
+
+        player = self.add_player_with_character(name, bag[-1])
+        # Only pop once the player is added, then keep the bag that adding reset
+        bag.pop()
+        self._role_bag = bag
+        return player
+
+    def add_players_with_random_roles(self, names: Iterable[str]) -> list[Player]:
+        """Add several players with random roles, adding none if any can't be added."""
+        names = list(names)
+        if len(names) > sum(self.included_roles.values()):
+            raise ValueError("Not enough roles to assign")
+
+        seen_names = set(self._players_by_name)
+        for name in names:
+            if name in seen_names:
+                raise ValueError(f"Player with name {name} already exists.")
+            seen_names.add(name)
+
+        # Each pick pops from the same shuffled bag, so this is one shuffle in total
+        return [self.add_player_with_random_role(name) for name in names]
 
     def add_player_with_character(self, name: str, character: Character) -> Player:
         """Add a player with a character to the game."""
-        self.included_roles.remove(character)
+        if name in self._players_by_name:
+            raise ValueError(f"Player with name {name} already exists.")
+
+        self._remove_included_role(character)
         # TODO: Handle lunatic/drunk
 
-        player = Player(name, character)
-        self.players.append(player)
-        return player
+        return self._add_player(Player(name, character))
 
     def add_player_as_traveler(self, name: str, traveler_name: str) -> Player:
         """Add a player as a traveler to the game."""
@@ -94,90 +230,104 @@ class Game:
         if traveler is None:
             raise ValueError(f"Traveler not found or in game: {traveler_name}")
 
-        player = Player(name, traveler)
+        if name in self._players_by_name:
+            raise ValueError(f"Player with name {name} already exists.")
+
+        return self._add_player(Player(name, traveler))
+
+    def _add_player(self, player: Player) -> Player:
+        """Add a player to the players and the player index."""
         self.players.append(player)
+        self._players_by_name[player.name] = player
         return player
 
     def get_player_by_name(self, name: str) -> Player | None:
         """Get a player by name."""
-        return next((player for player in self.players if player.name == name), None)
+        return self._players_by_name.get(name)
+
+    def rename_player(self, name: str, new_name: str) -> Player:
+        """Rename a player, keeping the player index in sync."""
+        player = self._players_by_name.get(name)
+        if player is None:
+            raise ValueError(f"Player not found: {name}")
+
+        if new_name != name and new_name in self._players_by_name:
+            raise ValueError(f"Player with name {new_name} already exists.")
+
+        # Players are only renamed here, so the index can't fall out of sync
+        del self._players_by_name[name]
+        player.name = new_name
+        self._players_by_name[new_name] = player
+        return player
 
     def remove_player_by_name(self, name: str) -> None:
         """Remove a player by name."""
-        player = self.get_player_by_name(name)
+        player = self._players_by_name.pop(name, None)
         if player is None:
             raise ValueError(f"Player not found: {name}")
 
         self.players.remove(player)
-        self.included_roles.append(player.character)
+        self._add_included_role(player.character)
 
     def character_with_name_is_alive(self, name: str) -> bool:
         """Check if a character with a given name is alive."""
+        # Normalize once instead of once per player in is_named
+        normalized_name = name.lower().strip()
         return any(
-            player.character.is_named(name) or player.is_alive
+            player.character.normalized_name == normalized_name and player.is_alive
             for player in self.players
         )
 
     def get_first_night_steps(self) -> Generator[NightStep, None, None]:
         """Get the first night steps."""
-        return self.filter_steps(self.script.get_first_night_steps())
+        return self.filter_steps(self._first_night_steps)
 
     def get_other_night_steps(self) -> Generator[NightStep, None, None]:
         """Get the other night steps."""
-        return self.filter_steps(self.script.get_other_night_steps())
+        return self.filter_steps(self._other_night_steps)
 
-    def filter_steps(self, steps: list[NightStep]) -> Generator[NightStep, None, None]:
+    def filter_steps(
+        self, steps: Iterable[NightStep]
+    ) -> Generator[NightStep, None, None]:
         """Filter steps based on the current game state."""
+        # Collect living characters once instead of scanning the players per step
+        living_names = {
+            player.character.normalized_name
+            for player in self.players
+            if player.is_alive
+        }
         for step in steps:
-            if step.always_show or self.character_with_name_is_alive(step.name):
+            if step.always_show or step.name.lower().strip() in living_names:
                 yield step
 
     def get_status_effects(self) -> list[StatusEffectOut]:
         """Get the status effects in the game."""
-        effects = list(
+        # Sort by character name so list order is consistent
+        return sorted(
             chain.from_iterable(
                 player.character.get_status_effects_out() for player in self.players
-            )
+            ),
+            key=attrgetter("character_name"),
         )
-        # Sort by character name so list order is consistent
-        effects.sort(key=lambda x: x.character_name)
-        return effects
 
     def get_unclaimed_travelers(self) -> list[Character]:
         """Get the unclaimed travelers."""
-        all_travelers = self.script.travelers
-        claimed_travelers = [player.character.name for player in self.players]
+        # Characters are singletons, so a set of them answers membership in O(1)
+        claimed_characters = {player.character for player in self.players}
         return [
             traveler
-            for traveler in all_travelers
-            if traveler.name not in claimed_travelers
+            for traveler in self.script.travelers
+            if traveler not in claimed_characters
         ]
 
     @classmethod
     def get_sample_game(cls) -> Game:
         """Get a sample game."""
         game = cls(ScriptName.TROUBLE_BREWING)
-        game.include_role("imp")
-        game.include_role("baron")
-        game.include_role("poisoner")
-        game.include_role("recluse")
-        game.include_role("librarian")
-        game.include_role("empath")
-        game.include_role("investigator")
-        game.include_role("mayor")
-        game.include_role("soldier")
-        game.include_role("slayer")
-        game.include_role("scarlet woman")
-        game.include_role("monk")
-
-        ryan = game.add_player_with_random_role("Ryan")
-        yash = game.add_player_with_random_role("Yash")
-        game.add_player_with_random_role("Other Ryan")
-        game.add_player_with_random_role("Other Yash")
-        game.add_player_with_random_role("Yet Another Ryan")
-        game.add_player_with_random_role("Yet Another Yash")
-        game.add_player_with_random_role("Even More Ryan")
-        game.add_player_with_random_role("Even More Yash")
+        for character in _SAMPLE_ROLES:
+            game._add_included_role(character)
+
+        ryan, yash, *_ = game.add_players_with_random_roles(_SAMPLE_PLAYER_NAMES)
 
         yash.add_status_effect("Drunk")
         yash.add_status_effect("No Ability")
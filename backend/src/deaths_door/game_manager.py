@@ -6,6 +6,8 @@ from .game import Game
 class GameManager:
     """Manager for the game."""
 
+    __slots__ = ("game", "lock")
+
     def __init__(self):
         """Create a new game manager."""
         self.game = Game.get_sample_game()
@@ -13,8 +15,9 @@ class GameManager:
 
     def get_game(self) -> Game:
         """Get the current game."""
-        with self.lock:
-            return self.game
+        # Reading a single attribute is atomic, so readers don't need the lock. They
+        # get whichever game was current at the time, even if it is replaced later.
+        return self.game
 
     def replace_game(self, new_game: Game):
         """Replace the current game."""
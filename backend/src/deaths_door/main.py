@@ -1,9 +1,23 @@
+from pathlib import Path
+from typing import Any
+
 from fastapi import FastAPI
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from .routes import characters, game, players, scripts, sounds, timer
 
+
+class CachedStaticFiles(StaticFiles):
+    """Static files that browsers may reuse for an hour before revalidating."""
+
+    def file_response(self, *args: Any, **kwargs: Any) -> Response:
+        """Add a Cache-Control header to the file response."""
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("Cache-Control", "public, max-age=3600")
+        return response
+
+
 app = FastAPI()
 app.include_router(sounds.router)
 app.include_router(scripts.router)
@@ -12,7 +26,7 @@ app.include_router(timer.timer)
 app.include_router(players.router)
 app.include_router(characters.router)
 
-app.mount("/static/", StaticFiles(directory="static", html=True), name="static")
+app.mount("/static/", CachedStaticFiles(directory="static", html=True), name="static")
 
 
 @app.get("/health")
@@ -23,11 +37,20 @@ def health():
 
 # Vanity routes for the web client
 
+# The favicon is tiny and never edited, so keep it in memory instead of reading it
+# per request. role.html is read from disk so edits show up without a restart.
+_FAVICON = Path("static/favicon.ico").read_bytes()
+
 
 @app.get("/favicon.ico")
 def favicon():
     """Health check for the service to validate connection."""
-    return FileResponse("static/favicon.ico", media_type="image/x-icon")
+    return Response(
+        _FAVICON,
+        media_type="image/x-icon",
+        # The favicon practically never changes, so let browsers keep it for a week
+        headers={"Cache-Control": "public, max-age=604800"},
+    )
 
 
 @app.get("/")
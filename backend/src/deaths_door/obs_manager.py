@@ -12,6 +12,12 @@ SCENE_NAME = "Countdown Scene"
 FONT_SIZE = 240
 
 
+def format_time(seconds: int) -> str:
+    """Format a number of seconds as the timer text, e.g. 5:00."""
+    minutes, seconds = divmod(seconds, 60)
+    return f"{minutes:01}:{seconds:02}"
+
+
 class ObsManager:
     """
     Communicate with OBS over the websocket.
@@ -32,6 +38,9 @@ class ObsManager:
     input_id: int = -1
     """The ID of the input for the countdown."""
 
+    last_time_text: None | str = None
+    """The timer text last shown in OBS, so unchanged updates can be skipped."""
+
     def __init__(self, host: str, port: int, password: str) -> None:
         """Create a new connection to OBS."""
         self.ws = obsws(host, port, password)
@@ -140,14 +149,17 @@ class ObsManager:
             },
         )
         self.input_id = el.sceneItemId
+        # The new text source doesn't show the last pushed text, so resend it
+        self.last_time_text = None
         self.set_scene_item_transform(self.input_id, {"scaleX": 2, "scaleY": 2})
 
     def update_timer(self, seconds: int) -> None:
         """Update the timer."""
         try:
             # Set the text to the current time
-            minutes, seconds = divmod(seconds, 60)
-            time_text = f"{minutes:01}:{seconds:02}"
+            time_text = format_time(seconds)
+            if time_text == self.last_time_text:
+                return
             self.set_input_settings(TIMER_NAME, {"text": time_text})
 
             # Center the text
@@ -155,6 +167,7 @@ class ObsManager:
             screen = self.get_video_settings()
             x = (screen.baseWidth - transform.width) / 2
             self.set_scene_item_transform(self.input_id, {"positionX": x})
+            self.last_time_text = time_text
 
         except Exception:  # noqa: S110
             # If we're not connected to OBS, don't add log lines regularly
@@ -29,13 +29,9 @@ class Player:
         """Create a new player, getting their alignment from the Character."""
         self.name = name
         self.character = character
-        self.alignment = character.get_alignment()
+        self.alignment = character.alignment
         self.status_effects = []
 
-    def set_name(self, name: str) -> None:
-        """Set the player's name."""
-        self.name = name
-
     def set_has_used_dead_vote(self, has_used_dead_vote: bool) -> None:
         """Mark a player as having used their dead vote."""
         self.has_used_dead_vote = has_used_dead_vote
@@ -73,4 +69,4 @@ class Player:
 
     def __repr__(self) -> str:
         """Return a string representation of the player."""
-        return f"Player({self.name}, {self.character.get_name()})"
+        return f"Player({self.name}, {self.character.name})"
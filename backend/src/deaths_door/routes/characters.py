@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
+from ..character import characters_to_out
 from ..game import Game
 from ..game_manager import get_current_game
 
@@ -10,7 +11,7 @@ router = APIRouter(prefix="/characters")
 @router.get("/list")
 async def get_game_roles(game: Game = Depends(get_current_game)):
     """List the names of roles present in the current game."""
-    return game.included_roles
+    return characters_to_out(game.get_included_roles())
 
 
 class AddRoleRequest(BaseModel):
@@ -36,8 +37,7 @@ async def add_role_multi(
     req: AddRoleMultiRequest, game: Game = Depends(get_current_game)
 ):
     """Add multiple roles to the current game."""
-    for name in req.names:
-        game.include_role(name)
+    game.include_roles(req.names)
 
 
 class RemoveRoleRequest(BaseModel):
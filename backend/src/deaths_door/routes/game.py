@@ -2,9 +2,10 @@ from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 from pydantic import BaseModel
 
+from ..character import characters_to_out
 from ..game import Game
 from ..game_manager import get_current_game, replace_game
-from ..script import ScriptName
+from ..script_name import ScriptName
 
 router = APIRouter(prefix="/game")
 
@@ -34,7 +35,7 @@ async def get_game_script(game: Game = Depends(get_current_game)):
 @router.get("/script/roles")
 async def get_game_script_roles(game: Game = Depends(get_current_game)):
     """Return the name of the script for the current game."""
-    return [c.to_out() for c in game.script.characters]
+    return characters_to_out(game.script.characters)
 
 
 @router.get("/script/night/first")
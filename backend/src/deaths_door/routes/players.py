@@ -181,11 +181,15 @@ async def rename_player(
     req: RenamePlayerRequest, game: Game = Depends(get_current_game)
 ):
     """Rename a player in the current game."""
-    player = game.get_player_by_name(req.name)
-    if player is None:
+    if game.get_player_by_name(req.name) is None:
         raise HTTPException(status_code=404, detail=f"Player not found: {req.name}")
 
-    player.set_name(req.new_name)
+    try:
+        player = game.rename_player(req.name, req.new_name)
+    except ValueError as e:
+        # The only remaining failure is the new name being taken
+        raise HTTPException(status_code=409, detail=e.args) from e
+
     return player.to_out()
 
 
@@ -1,48 +1,84 @@
-from fastapi import APIRouter
+import hashlib
+from functools import cache
+from typing import Any
+
+from fastapi import APIRouter, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import HTTPException
+from fastapi.responses import JSONResponse, Response
 
-from ..script import ScriptName
+from ..character import characters_to_out
+from ..script import Script
+from ..script_name import ScriptName
 from ..scripts.registry import get_script_by_name
 
 router = APIRouter(prefix="/scripts")
 
 
+def _encode(payload: Any) -> tuple[bytes, str]:
+    """Encode a payload the way FastAPI would, along with an ETag for it."""
+    body = bytes(JSONResponse(jsonable_encoder(payload)).body)
+    return body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _respond(request: Request, body: bytes, etag: str) -> Response:
+    """Return the encoded payload, or 304 if the client already has it."""
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=300"}
+    if_none_match = request.headers.get("if-none-match", "")
+    # Weak comparison, as in StaticFiles.is_not_modified
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    if "*" in tags or etag in tags:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+# Script data never changes while the server runs, so each response body and its
+# ETag are only computed once
+_SCRIPT_NAMES_BODY, _SCRIPT_NAMES_ETAG = _encode({x.value: str(x) for x in ScriptName})
+
+
+@cache
+def _encode_roles(script: Script) -> tuple[bytes, str]:
+    """Encode the roles payload for a script, once per script."""
+    return _encode(characters_to_out(script.characters))
+
+
 @router.get("/list")
-async def read_scripts():
+def read_scripts(request: Request):
     """Return a list of available scripts."""
-    return {x: str(x) for x in list(ScriptName)}
+    return _respond(request, _SCRIPT_NAMES_BODY, _SCRIPT_NAMES_ETAG)
 
 
 @router.get("/{script_name}/role")
-async def read_roles(script_name: str):
+def read_roles(script_name: str, request: Request):
     """List the roles for the given script."""
     script = get_script_by_name(script_name)
     if script is None:
         raise HTTPException(status_code=404, detail="Script not found")
 
-    return [char.to_out() for char in script.characters]
+    return _respond(request, *_encode_roles(script))
 
 
 @router.get("/{script_name}/travelers")
-async def read_travelers(script_name: str):
+def read_travelers(script_name: str):
     """List the travelers for the given script."""
     script = get_script_by_name(script_name)
     if script is None:
         raise HTTPException(status_code=404, detail="Script not found")
 
-    return [char.to_out() for char in script.travelers]
+    return characters_to_out(script.travelers)
 
 
 # TODO: Can we consolidate this into the method above?
 # I don't have internet so I can't check the docs.
 @router.get("/{script_name}/role/{name}")
-async def read_role(script_name: str, role_name: str):
+def read_role(script_name: str, name: str):
     """Get a given role for a script."""
     script = get_script_by_name(script_name)
     if script is None:
         raise HTTPException(status_code=404, detail="Script not found")
 
-    char = script.get_character(role_name)
+    char = script.get_character(name)
 
     if char is None:
         raise HTTPException(status_code=404, detail="Role not found")
@@ -1,4 +1,5 @@
 from fastapi import APIRouter
+from fastapi.concurrency import run_in_threadpool
 from fastapi.exceptions import HTTPException
 
 from ..sound_fx import SoundFX, SoundName, sounds
@@ -15,7 +16,9 @@ async def play_sound(name: str):
         raise HTTPException(status_code=404, detail="Sound not found")
 
     try:
-        SoundFX().play(sound_name)
+        # Initializing the mixer and loading a sound hit the audio device and disk,
+        # so keep them off the event loop
+        await run_in_threadpool(lambda: SoundFX().play(sound_name))
     except Exception as e:
         raise HTTPException(status_code=500, detail="Failed to play sound") from e
 
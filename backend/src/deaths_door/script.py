@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 from .character import Character
 from .night_step import NightStep
 from .script_name import ScriptName
@@ -13,13 +15,18 @@ class Script:
     name: ScriptName
     first_night_steps: list[NightStep]
     other_night_steps: list[NightStep]
+    _characters_by_name: dict[str, Character]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Index the subclass's characters by name once."""
+        super().__init_subclass__(**kwargs)
+        cls._characters_by_name = {
+            character.normalized_name: character for character in cls.characters
+        }
 
     def get_character(self, name: str) -> Character | None:
         """Get a character by name."""
-        for character in self.characters:
-            if character.is_named(name):
-                return character
-        return None
+        return self._characters_by_name.get(name.lower().strip())
 
     def has_character(self, name: str) -> bool:
         """Return True if the character is in the given script."""
@@ -23,6 +23,8 @@ class ScriptName(str, Enum):
     @classmethod
     def from_str(cls, name: str) -> ScriptName | None:
         """Return the ScriptName for a given string if present, else return none."""
-        for script in cls:
-            if script.value == name.lower():
-                return script
+        # Looking up by value is a dict hit, unlike scanning the members
+        try:
+            return cls(name.lower())
+        except ValueError:
+            return None
@@ -1,3 +1,5 @@
+from functools import cache
+
 from ..script import Script
 from ..script_name import ScriptName
 from .trouble_brewing import TroubleBrewing
@@ -5,7 +7,18 @@ from .trouble_brewing import TroubleBrewing
 
 def get_script_by_name(name: str) -> Script | None:
     """Return the Script for a given string if present, else return none."""
-    match ScriptName.from_str(name):
+    script_name = ScriptName.from_str(name)
+    if script_name is None:
+        return None
+    return _get_script(script_name)
+
+
+# Scripts only hold class-level data, so one instance per script can be shared.
+# Cached by ScriptName rather than the raw string so arbitrary names from requests
+# don't grow the cache.
+@cache
+def _get_script(script_name: ScriptName) -> Script | None:
+    match script_name:
         case ScriptName.TROUBLE_BREWING:
             return TroubleBrewing()
         case _:
@@ -81,15 +81,15 @@ class TroubleBrewing(Script):
         NightStep(
             name="Minion Info",
             description="If there are 7 or more players, wake all Minions: "
-            + "Show the THIS IS THE DEMON token. Point to the Demon.",
+            "Show the THIS IS THE DEMON token. Point to the Demon.",
             always_show=True,
         ),
         NightStep(
             name="Demon Info",
             description="If there are 7 or more players, wake the Demon: "
-            + "Show the THESE ARE YOUR MINIONS token. Point to all Minions. "
-            + "Show the THESE CHARACTERS ARE NOT IN PLAY token. "
-            + "Show 3 not-in-play good character tokens.",
+            "Show the THESE ARE YOUR MINIONS token. Point to all Minions. "
+            "Show the THESE CHARACTERS ARE NOT IN PLAY token. "
+            "Show 3 not-in-play good character tokens.",
             always_show=True,
         ),
         NightStep(name="Poisoner", description="The Poisoner chooses a player."),
@@ -100,24 +100,24 @@ class TroubleBrewing(Script):
         NightStep(
             name="Washerwoman",
             description="Show the Townsfolk character token. "
-            + "Point to both the TOWNSFOLK and WRONG players.",
+            "Point to both the TOWNSFOLK and WRONG players.",
         ),
         NightStep(
             name="Librarian",
             description="Show the Outsider character token. "
-            + "Point to both the OUTSIDER and WRONG players.",
+            "Point to both the OUTSIDER and WRONG players.",
         ),
         NightStep(
             name="Investigator",
             description="Show the Minion character token. "
-            + "Point to both the MINION and WRONG players.",
+            "Point to both the MINION and WRONG players.",
         ),
         NightStep(name="Chef", description="Give a finger signal."),
         NightStep(name="Empath", description="Give a finger signal."),
         NightStep(
             name="Fortune Teller",
             description="The Fortune Teller chooses 2 players. "
-            + "Nod if either is the Demon (or the RED HERRING).",
+            "Nod if either is the Demon (or the RED HERRING).",
         ),
         NightStep(name="Butler", description="The Butler chooses a player."),
         NightStep(
@@ -141,7 +141,7 @@ class TroubleBrewing(Script):
         NightStep(
             name="Scarlet Woman",
             description="If the Scarlet Woman became the Imp today, "
-            + "show them the YOU ARE token, then the Imp token.",
+            "show them the YOU ARE token, then the Imp token.",
         ),
         NightStep(
             name="Imp",
@@ -155,8 +155,8 @@ class TroubleBrewing(Script):
         NightStep(
             name="Ravenkeeper",
             description="If the Ravenkeeper died tonight, "
-            + "the Ravenkeeper chooses a player. "
-            + "Show that player's character token.",
+            "the Ravenkeeper chooses a player. "
+            "Show that player's character token.",
         ),
         NightStep(
             name="Undertaker",
@@ -166,13 +166,13 @@ class TroubleBrewing(Script):
         NightStep(
             name="Fortune Teller",
             description="The Fortune Teller chooses 2 players. "
-            + "Nod if either is the Demon (or the RED HERRING).",
+            "Nod if either is the Demon (or the RED HERRING).",
         ),
         NightStep(name="Butler", description="The Butler chooses a player."),
         NightStep(
             name="Dawn",
             description="Wait a few seconds. "
-            + "Call for eyes open & immediately say who died.",
+            "Call for eyes open & immediately say who died.",
             always_show=True,
         ),
     ]
@@ -28,9 +28,11 @@ class SoundName(str, Enum):
     @classmethod
     def from_str(cls, name: str) -> SoundName | None:
         """Return the SoundName for a given string if present, else return none."""
-        for script in cls:
-            if script.value == name.lower():
-                return script
+        # Looking up by value is a dict hit, unlike scanning the members
+        try:
+            return cls(name.lower())
+        except ValueError:
+            return None
 
 
 sounds: dict[str, list[SoundName]] = {
@@ -45,20 +47,24 @@ class SoundFX:
     """Collection of all our sound files."""
 
     _instance: None | SoundFX = None
+    # Sounds loaded so far, so each file is only read from disk once
+    _sounds: dict[SoundName, pygame.mixer.Sound] = {}
 
     def __new__(cls) -> SoundFX:
         """Return the existing instance of the class, if present."""
         if cls._instance is None:
+            # Init the mixer before storing the instance, so a failed init is retried
+            pygame.mixer.init()
             cls._instance = super(SoundFX, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
-        """Init the pygame mixer."""
-        pygame.mixer.init()
-
     def get_sound(self, sound_name: SoundName):
         """Return the sound effect for a given name."""
-        return pygame.mixer.Sound(f"src/assets/sound_fx/{sound_name.value}.wav")
+        sound = self._sounds.get(sound_name)
+        if sound is None:
+            sound = pygame.mixer.Sound(f"src/assets/sound_fx/{sound_name.value}.wav")
+            self._sounds[sound_name] = sound
+        return sound
 
     def play(self, sound_name: SoundName):
         """Play and return the given sound."""
@@ -1,9 +1,13 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class StatusEffectOut(BaseModel):
     """A collection of status effects."""
 
+    # Instances are cached and shared per character class, see
+    # Character.get_status_effects_out
+    model_config = ConfigDict(frozen=True)
+
     name: str
     character_name: str
 
@@ -11,6 +15,9 @@ class StatusEffectOut(BaseModel):
 class StatusEffect:
     """A status effect that can be applied to a character."""
 
+    # Status effects have no instance state, so don't give them a __dict__
+    __slots__ = ()
+
     name: str
 
     def to_out(self, character_name: str) -> StatusEffectOut:
@@ -21,88 +28,121 @@ class StatusEffect:
 class IsTheDrunk(StatusEffect):
     """The Is the Drunk status effect."""
 
+    __slots__ = ()
     name = "Is the Drunk"
 
 
 class Poisoned(StatusEffect):
     """The Poisoned status effect."""
 
+    __slots__ = ()
     name = "Poisoned"
 
 
 class Safe(StatusEffect):
     """The Safe status effect."""
 
+    __slots__ = ()
     name = "Safe"
 
 
 class ButlersMaster(StatusEffect):
     """The Butler's Master status effect."""
 
+    __slots__ = ()
     name = "Butler's Master"
 
 
 class Dead(StatusEffect):
     """The Dead status effect."""
 
+    __slots__ = ()
     name = "Dead"
 
 
 class DiedToday(StatusEffect):
     """The Died Today status effect."""
 
+    __slots__ = ()
     name = "Died Today"
 
 
 class InvestigatorMinion(StatusEffect):
     """The Investigator Minion status effect."""
 
+    __slots__ = ()
     name = "Investigator's Minion"
 
 
 class InvestigatorWrong(StatusEffect):
     """The Investigator Wrong status effect."""
 
+    __slots__ = ()
     name = "Investigator's Wrong"
 
 
 class IsTheDemon(StatusEffect):
     """The Is the Demon status effect."""
 
+    __slots__ = ()
     name = "Is the Demon"
 
 
 class NoAbility(StatusEffect):
     """The No Ability status effect."""
 
+    __slots__ = ()
     name = "No Ability"
 
 
 class RedHerring(StatusEffect):
     """The Red Herring status effect."""
 
+    __slots__ = ()
     name = "Fortune Teller's Red Herring"
 
 
 class LibrarianOutsider(StatusEffect):
     """The Librarian Outsider status effect."""
 
+    __slots__ = ()
     name = "Librarian's Outsider"
 
 
 class LibrarianWrong(StatusEffect):
     """The Librarian Wrong status effect."""
 
+    __slots__ = ()
     name = "Librarian's Wrong"
 
 
 class WasherwomanTownsfolk(StatusEffect):
     """The Washerwoman Townsfolk status effect."""
 
+    __slots__ = ()
     name = "Washerwoman's Townsfolk"
 
 
 class WasherwomanWrong(StatusEffect):
     """The Washerwoman Wrong status effect."""
 
+    __slots__ = ()
     name = "Washerwoman's Wrong"
+
+
+# Status effects carry no per-character state, so characters share these
+IS_THE_DRUNK = IsTheDrunk()
+POISONED = Poisoned()
+SAFE = Safe()
+BUTLERS_MASTER = ButlersMaster()
+DEAD = Dead()
+DIED_TODAY = DiedToday()
+INVESTIGATOR_MINION = InvestigatorMinion()
+INVESTIGATOR_WRONG = InvestigatorWrong()
+IS_THE_DEMON = IsTheDemon()
+NO_ABILITY = NoAbility()
+RED_HERRING = RedHerring()
+LIBRARIAN_OUTSIDER = LibrarianOutsider()
+LIBRARIAN_WRONG = LibrarianWrong()
+WASHERWOMAN_TOWNSFOLK = WasherwomanTownsfolk()
+WASHERWOMAN_WRONG = WasherwomanWrong()
@@ -1,7 +1,9 @@
+from collections import Counter
+
 import pytest
 
 from deaths_door.game import Game
-from deaths_door.script import ScriptName
+from deaths_door.script_name import ScriptName
 
 
 @pytest.mark.anyio
@@ -9,3 +11,131 @@ async def test_add_role():
     """Asserts that we return a fun message."""
     game = Game(script_name=ScriptName.TROUBLE_BREWING)
     game.add_player_with_role("Ryan", "imp")
+
+
+@pytest.mark.anyio
+async def test_renamed_player_is_found_by_new_name():
+    """Asserts that renaming a player moves them to the new name."""
+    game = Game(script_name=ScriptName.TROUBLE_BREWING)
+    game.include_role("imp")
+    player = game.add_player_with_role("Ryan", "imp")
+
+    game.rename_player("Ryan", "Yash")
+
+    assert game.get_player_by_name("Ryan") is None
+    assert game.get_player_by_name("Yash") is player
+
+
+@pytest.mark.anyio
+async def test_role_included_twice_can_be_assigned_twice():
+    """Asserts that removing one copy of a role leaves the other assignable."""
+    game = Game(script_name=ScriptName.TROUBLE_BREWING)
+    game.include_role("imp")
+    game.include_role("imp")
+    game.add_player_with_role("Ryan", "imp")
+    game.add_player_with_role("Yash", "imp")
+
+    with pytest.raises(ValueError):
+        game.add_player_with_role("Other Ryan", "imp")
+
+
+@pytest.mark.anyio
+async def test_night_steps_only_include_living_characters():
+    """Asserts that steps for dead or absent characters are filtered out."""
+    game = Game(script_name=ScriptName.TROUBLE_BREWING)
+    game.include_role("imp")
+    player = game.add_player_with_role("Ryan", "imp")
+
+    step_names = [step.name for step in game.get_other_night_steps()]
+    assert "Imp" in step_names
+    assert "Poisoner" not in step_names
+
+    player.set_is_alive(False)
+
+    assert "Imp" not in [step.name for step in game.get_other_night_steps()]
+
+
+@pytest.mark.anyio
+async def test_include_roles_with_unknown_name_changes_nothing():
+    """Asserts that one bad name in a batch leaves the included roles untouched."""
+    game = Game(script_name=ScriptName.TROUBLE_BREWING)
+    game.include_role("imp")
+    before = game.get_included_roles()
+
+    with pytest.raises(ValueError):
+        game.include_roles(["baron", "nope"])
+
+    assert game.get_included_roles() == before
+
+
+@pytest.mark.anyio
+async def test_character_with_name_is_alive():
+    """Asserts that only a living player's character counts as alive."""
+    game = Game(script_name=ScriptName.TROUBLE_BREWING)
+    game.include_role("imp")
+    player = game.add_player_with_role("Ryan", "imp")
+
+    assert game.character_with_name_is_alive(" Imp ")
+    assert not game.character_with_name_is_alive("poisoner")
+
+    player.set_is_alive(False)
+
+    assert not game.character_with_name_is_alive("imp")
+
+
+@pytest.mark.anyio
+async def test_rename_to_taken_name_keeps_both_players():
+    """Asserts that renaming onto an existing name fails and changes nothing."""
+    game = Game(script_name=ScriptName.TROUBLE_BREWING)
+    game.include_role("imp")
+    game.include_role("baron")
+    ryan = game.add_player_with_role("Ryan", "imp")
+    yash = game.add_player_with_role("Yash", "baron")
+
+    with pytest.raises(ValueError):
+        game.rename_player("Ryan", "Yash")
+
+    assert ryan.name == "Ryan"
+    assert game.get_player_by_name("Ryan") is ryan
+    assert game.get_player_by_name("Yash") is yash
+
+
+@pytest.mark.anyio
+async def test_failed_random_batch_adds_no_players():
+    """Asserts that a batch that can't be fully assigned adds nobody."""
+    game = Game(script_name=ScriptName.TROUBLE_BREWING)
+    game.include_role("imp")
+    game.include_role("baron")
+    ryan = game.add_player_with_random_role("Ryan")
+    roles_before = game.get_included_roles()
+
+    with pytest.raises(ValueError):
+        game.add_players_with_random_roles(["Yash", "Other Ryan"])
+    with pytest.raises(ValueError):
+        game.add_players_with_random_roles(["Ryan"])
+
+    assert game.players == [ryan]
+    assert game.get_included_roles() == roles_before
+
+    # The role left in the bag is still handed out
+    (yash,) = game.add_players_with_random_roles(["Yash"])
+    assert [yash.character] == roles_before
+    assert game.get_included_roles() == []
+
+
+@pytest.mark.anyio
+async def test_random_roles_use_each_included_role_its_count():
+    """Asserts that random assignment hands out exactly the included roles."""
+    game = Game(script_name=ScriptName.TROUBLE_BREWING)
+    for role_name in ["imp", "baron", "baron", "chef", "chef", "chef"]:
+        game.include_role(role_name)
+    expected = Counter(game.get_included_roles())
+
+    players = [
+        game.add_player_with_random_role(f"Player {i}")
+        for i in range(sum(expected.values()))
+    ]
+
+    assert Counter(player.character for player in players) == expected
+    with pytest.raises(ValueError):
+        game.add_player_with_random_role("One Too Many")
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import pytest
 from httpx import AsyncClient
 
@@ -8,10 +10,61 @@ from deaths_door.main import app
 async def test_hello_world_succeeds():
     """Asserts that we return a fun message."""
     async with AsyncClient(app=app, base_url="http://test") as ac:
-        response = await ac.get("/script/list")
+        response = await ac.get("/scripts/list")
     assert response.status_code == 200
     assert response.json() == {
         "trouble_brewing": "Trouble Brewing",
         "sects_and_violets": "Sects and Violets",
         "bad_moon_rising": "Bad Moon Rising",
     }
+
+
+@pytest.mark.anyio
+async def test_favicon_is_served_with_long_cache():
+    """Asserts that the favicon is served from memory with a week-long cache."""
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        response = await ac.get("/favicon.ico")
+    assert response.status_code == 200
+    assert response.content == Path("static/favicon.ico").read_bytes()
+    assert response.headers["cache-control"] == "public, max-age=604800"
+
+
+@pytest.mark.anyio
+async def test_static_files_are_cacheable():
+    """Asserts that static icons can be reused by browsers for an hour."""
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        response = await ac.get("/static/icons/imp.png")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=3600"
+
+
+@pytest.mark.anyio
+async def test_matching_etag_is_not_modified():
+    """Asserts that sending back the ETag gets an empty 304."""
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        response = await ac.get("/scripts/trouble_brewing/role")
+        etag = response.headers["etag"]
+        cached = await ac.get(
+            "/scripts/trouble_brewing/role", headers={"If-None-Match": f"W/{etag}"}
+        )
+    assert response.status_code == 200
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+
+@pytest.mark.anyio
+async def test_read_role_returns_character():
+    """Asserts that a single role is returned by name."""
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        response = await ac.get("/scripts/trouble_brewing/role/imp")
+    assert response.status_code == 200
+    assert response.json() == {
+        "name": "Imp",
+        "description": (
+            "Each night*, choose a player: they die. "
+            "If you chose yourself, you die & a Minion becomes the Imp."
+        ),
+        "icon_path": "imp.png",
+        "alignment": "evil",
+        "category": "demon",
+    }
@@ -0,0 +1,94 @@
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from deaths_door.obs_manager import ObsManager
+
+_TRANSFORM = {
+    "alignment": 5,
+    "boundsAlignment": 0,
+    "boundsHeight": 0.0,
+    "boundsType": "OBS_BOUNDS_NONE",
+    "boundsWidth": 0.0,
+    "cropBottom": 0,
+    "cropLeft": 0,
+    "cropRight": 0,
+    "cropTop": 0,
+    "height": 240.0,
+    "positionX": 0.0,
+    "positionY": 0.0,
+    "rotation": 0.0,
+    "scaleX": 2.0,
+    "scaleY": 2.0,
+    "sourceHeight": 120.0,
+    "sourceWidth": 200.0,
+    "width": 400.0,
+}
+
+_RESPONSES: dict[str, dict[str, Any]] = {
+    "GetSceneList": {"scenes": []},
+    "CreateInput": {"inputUuid": "timer", "sceneItemId": 1},
+    "GetSceneItemTransform": {"sceneItemTransform": _TRANSFORM},
+    "GetVideoSettings": {
+        "baseHeight": 1080,
+        "baseWidth": 1920,
+        "fpsDenominator": 1,
+        "fpsNumerator": 30,
+        "outputHeight": 1080,
+        "outputWidth": 1920,
+    },
+}
+
+
+class StubObsManager(ObsManager):
+    """An ObsManager that records requests instead of sending them to OBS."""
+
+    calls: list[str]
+    fail: bool
+
+    def __init__(self) -> None:
+        """Start without a websocket connection."""
+        self.run_id = "test"
+        self.calls = []
+        self.fail = False
+
+    def call(self, request: Any) -> Any:
+        """Record the request and answer it with canned data."""
+        if self.fail:
+            raise ConnectionError("OBS is not connected")
+        self.calls.append(request.name)
+        return SimpleNamespace(datain=_RESPONSES.get(request.name, {}))
+
+
+@pytest.mark.anyio
+async def test_unchanged_timer_text_is_not_resent():
+    """Asserts that repeating a time skips OBS until the scene is rebuilt."""
+    obs = StubObsManager()
+    obs.setup_obs_scene()
+
+    obs.update_timer(300)
+    assert "SetInputSettings" in obs.calls
+
+    obs.calls.clear()
+    obs.update_timer(300)
+    assert obs.calls == []
+
+    obs.setup_obs_scene()
+    obs.calls.clear()
+    obs.update_timer(300)
+    assert "SetInputSettings" in obs.calls
+
+
+@pytest.mark.anyio
+async def test_failed_timer_update_is_retried():
+    """Asserts that a time that failed to reach OBS is sent again."""
+    obs = StubObsManager()
+    obs.setup_obs_scene()
+
+    obs.fail = True
+    obs.update_timer(299)
+    obs.fail = False
+    obs.update_timer(299)
+
+    assert "SetInputSettings" in obs.calls
@@ -0,0 +1,26 @@
+import pygame
+import pytest
+
+from deaths_door.sound_fx import SoundFX, SoundName
+
+
+@pytest.mark.anyio
+async def test_each_sound_is_loaded_once(monkeypatch: pytest.MonkeyPatch):
+    """Asserts that asking for a sound twice only reads it from disk once."""
+    loaded: list[str] = []
+
+    def load_sound(path: str) -> str:
+        loaded.append(path)
+        return path
+
+    monkeypatch.setattr(pygame.mixer, "init", lambda: None)
+    monkeypatch.setattr(pygame.mixer, "Sound", load_sound)
+    monkeypatch.setattr(SoundFX, "_instance", None)
+    monkeypatch.setattr(SoundFX, "_sounds", {})
+
+    sound_fx = SoundFX()
+    first = sound_fx.get_sound(SoundName.ROOSTER)
+    second = sound_fx.get_sound(SoundName.ROOSTER)
+
+    assert first is second
+    assert loaded == ["src/assets/sound_fx/rooster.wav"]
@@ -6,13 +6,11 @@ from ...character_type import CharacterType
 class Apprentice(Character):
     """Apprentice character."""
 
-    def __init__(self):
-        """Initialize the Apprentice character."""
-        self.name = "Apprentice"
-        self.description = (
-            "On your 1st night, you gain a Townsfolk ability "
-            + "(if good), or a Minion ability (if evil)."
-        )
-        self.category = CharacterType.TRAVELER
-        self.alignment = Alignment.UNKNOWN
-        self.status_effects = []
+    __slots__ = ()
+    name = "Apprentice"
+    description = (
+        "On your 1st night, you gain a Townsfolk ability "
+        "(if good), or a Minion ability (if evil)."
+    )
+    category = CharacterType.TRAVELER
+    alignment = Alignment.UNKNOWN